@@ -0,0 +1,277 @@
+/* Modbus CRC-16 (polynomial 0x8005, reflected 0xA001, init 0xFFFF).
+ *
+ * Optional native backend for pymodbus.framer.rtu.FramerRTU.compute_CRC.
+ *
+ * Blocks of 16 bytes are folded with carry-less multiplication as described
+ * in Intel's "Fast CRC Computation for Generic Polynomials Using PCLMULQDQ",
+ * the 128 bit remainder is reduced to 64 bits and finally Barrett reduced to
+ * 16 bits. Bytes not covered by whole blocks are handled by the classic
+ * table driven loop, which is also used when no carry-less multiply is
+ * available.
+ *
+ * The kernel is shared between x86-64 (PCLMULQDQ) and ARMv8 (PMULL), only
+ * the small v128 helpers below differ. The hardware CRC instructions
+ * (SSE4.2 crc32, ARMv8 crc32/crc32c) are not used, they only implement the
+ * CRC-32 and CRC-32C polynomials, not the modbus polynomial.
+ *
+ * The kernel is selected once at import, from cpuid on x86-64 and from
+ * the HWCAP auxiliary vector on linux aarch64, so a module built on one
+ * machine runs on any cpu of the same architecture. BACKEND names the
+ * selected kernel: "clmul-x86", "pmull-arm" or "table1" (bytewise table).
+ *
+ * All constants are bit reflected. A fold over a distance of T bits uses
+ * rev64(x^(T-1) mod P), the 16 bit remainder sits at the top of the 64 bit
+ * lane, the -1 compensates for the product of two reflected 64 bit values
+ * being 127 bits wide.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stddef.h>
+#include <stdint.h>
+
+#if defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define CRC16_CLMUL_X86 1
+#define CRC16_TARGET __attribute__((target("pclmul,sse4.1")))
+#include <smmintrin.h>
+#include <wmmintrin.h>
+#elif defined(__aarch64__) && (defined(__ARM_FEATURE_CRYPTO) || defined(__ARM_FEATURE_AES))
+#define CRC16_CLMUL_ARM 1
+#define CRC16_TARGET
+#include <arm_neon.h>
+#if defined(__linux__)
+#include <sys/auxv.h>
+#ifndef HWCAP_PMULL
+#define HWCAP_PMULL (1 << 4)
+#endif
+#endif
+#endif
+
+
+static uint16_t crc16_table[256];
+
+
+static void
+crc16_table_init(void)
+{
+    for (unsigned int byte = 0; byte < 256; byte++) {
+        uint16_t crc = (uint16_t)byte;
+        for (int bit = 0; bit < 8; bit++) {
+            crc = (crc & 1) ? (uint16_t)((crc >> 1) ^ 0xA001) : (uint16_t)(crc >> 1);
+        }
+        crc16_table[byte] = crc;
+    }
+}
+
+
+static uint16_t
+crc16_bytewise(uint16_t crc, const uint8_t *buf, size_t len)
+{
+    while (len--) {
+        crc = (uint16_t)((crc >> 8) ^ crc16_table[(crc ^ *buf++) & 0xFF]);
+    }
+    return crc;
+}
+
+
+#if defined(CRC16_CLMUL_X86)
+typedef __m128i v128;
+
+static inline CRC16_TARGET v128 v128_load(const uint8_t *buf) { return _mm_loadu_si128((const __m128i *)buf); }
+static inline CRC16_TARGET v128 v128_set(uint64_t hi, uint64_t lo) { return _mm_set_epi64x((long long)hi, (long long)lo); }
+static inline CRC16_TARGET v128 v128_xor(v128 a, v128 b) { return _mm_xor_si128(a, b); }
+static inline CRC16_TARGET uint64_t v128_lo(v128 a) { return (uint64_t)_mm_cvtsi128_si64(a); }
+static inline CRC16_TARGET uint64_t v128_hi(v128 a) { return (uint64_t)_mm_extract_epi64(a, 1); }
+/* low lane * low lane, high lane * high lane */
+static inline CRC16_TARGET v128 clmul_lo(v128 a, v128 b) { return _mm_clmulepi64_si128(a, b, 0x00); }
+static inline CRC16_TARGET v128 clmul_hi(v128 a, v128 b) { return _mm_clmulepi64_si128(a, b, 0x11); }
+#define CRC16_CLMUL 1
+
+#elif defined(CRC16_CLMUL_ARM)
+typedef uint64x2_t v128;
+
+static inline CRC16_TARGET v128 v128_load(const uint8_t *buf) { return vreinterpretq_u64_u8(vld1q_u8(buf)); }
+static inline CRC16_TARGET v128 v128_set(uint64_t hi, uint64_t lo) { return vcombine_u64(vcreate_u64(lo), vcreate_u64(hi)); }
+static inline CRC16_TARGET v128 v128_xor(v128 a, v128 b) { return veorq_u64(a, b); }
+static inline CRC16_TARGET uint64_t v128_lo(v128 a) { return vgetq_lane_u64(a, 0); }
+static inline CRC16_TARGET uint64_t v128_hi(v128 a) { return vgetq_lane_u64(a, 1); }
+/* low lane * low lane, high lane * high lane */
+static inline CRC16_TARGET v128 clmul_lo(v128 a, v128 b)
+{
+    return vreinterpretq_u64_p128(vmull_p64((poly64_t)vgetq_lane_u64(a, 0), (poly64_t)vgetq_lane_u64(b, 0)));
+}
+static inline CRC16_TARGET v128 clmul_hi(v128 a, v128 b)
+{
+    return vreinterpretq_u64_p128(vmull_high_p64(vreinterpretq_p64_u64(a), vreinterpretq_p64_u64(b)));
+}
+#define CRC16_CLMUL 1
+#endif
+
+
+#ifdef CRC16_CLMUL
+/* rev64(x^575 mod P), rev64(x^511 mod P): fold by 4 blocks (512 bits) */
+#define K_FOLD4_LO 0xC450000000000000ULL
+#define K_FOLD4_HI 0x8101000000000000ULL
+/* rev64(x^191 mod P), rev64(x^127 mod P): fold by 1 block (128 bits) */
+#define K_FOLD1_LO 0xCCD0000000000000ULL
+#define K_FOLD1_HI 0xC100000000000000ULL
+/* rev64(x^79 mod P), rev64(x^15): multiply 128 bit remainder by x^16 */
+#define K_128_LO 0xCCC1000000000000ULL
+#define K_128_HI 0x0001000000000000ULL
+/* rev64(x^63 mod P): reduce 80 bits to 64 bits */
+#define K_80 0xD101000000000000ULL
+/* rev49(floor(x^64 / P)) and rev17(P): Barrett reduction */
+#define K_MU 0x1EBFFCFFFBFFFULL
+#define K_POLY 0x14003ULL
+
+
+static inline CRC16_TARGET v128
+fold(v128 x, v128 k, v128 next)
+{
+    return v128_xor(v128_xor(clmul_lo(x, k), clmul_hi(x, k)), next);
+}
+
+
+static inline CRC16_TARGET uint64_t
+clmul64_lo(uint64_t a, uint64_t b)
+{
+    return v128_lo(clmul_lo(v128_set(0, a), v128_set(0, b)));
+}
+
+
+/* len must be a non zero multiple of 16 */
+static CRC16_TARGET uint16_t
+crc16_clmul(const uint8_t *buf, size_t len)
+{
+    const v128 k1 = v128_set(K_FOLD1_HI, K_FOLD1_LO);
+    const v128 zero = v128_set(0, 0);
+    v128 x0;
+
+    x0 = v128_xor(v128_load(buf), v128_set(0, 0xFFFF));
+    if (len >= 64) {
+        const v128 k4 = v128_set(K_FOLD4_HI, K_FOLD4_LO);
+        v128 x1, x2, x3;
+
+        x1 = v128_load(buf + 16);
+        x2 = v128_load(buf + 32);
+        x3 = v128_load(buf + 48);
+        buf += 64;
+        len -= 64;
+        while (len >= 64) {
+            x0 = fold(x0, k4, v128_load(buf));
+            x1 = fold(x1, k4, v128_load(buf + 16));
+            x2 = fold(x2, k4, v128_load(buf + 32));
+            x3 = fold(x3, k4, v128_load(buf + 48));
+            buf += 64;
+            len -= 64;
+        }
+        x0 = fold(x0, k1, x1);
+        x0 = fold(x0, k1, x2);
+        x0 = fold(x0, k1, x3);
+    } else {
+        buf += 16;
+        len -= 16;
+    }
+    while (len >= 16) {
+        x0 = fold(x0, k1, v128_load(buf));
+        buf += 16;
+        len -= 16;
+    }
+
+    /* remainder * x^16, folded to 80 bits, then to 64 bits */
+    x0 = fold(x0, v128_set(K_128_HI, K_128_LO), zero);
+    uint64_t u = v128_hi(x0) ^ v128_hi(clmul_lo(x0, v128_set(0, K_80)));
+
+    /* Barrett reduction of the 64 bit remainder */
+    uint64_t q = clmul64_lo(u & 0xFFFFFFFFFFFFULL, K_MU);
+    uint64_t r = clmul64_lo((q >> 32) & 0xFFFF, K_POLY);
+    return (uint16_t)((u >> 48) ^ ((r >> 16) & 0xFFFF));
+}
+#endif
+
+
+/* crc16 of whole 16 byte blocks, NULL if the cpu has no carry-less multiply */
+static uint16_t (*crc16_blocks)(const uint8_t *buf, size_t len);
+static const char *crc16_backend = "table1";
+
+
+static void
+crc16_select(void)
+{
+#if defined(CRC16_CLMUL_X86)
+    __builtin_cpu_init();
+    if (__builtin_cpu_supports("pclmul") && __builtin_cpu_supports("sse4.1")) {
+        crc16_blocks = crc16_clmul;
+        crc16_backend = "clmul-x86";
+    }
+#elif defined(CRC16_CLMUL_ARM)
+#if defined(__linux__)
+    if (getauxval(AT_HWCAP) & HWCAP_PMULL)
+#endif
+    {
+        crc16_blocks = crc16_clmul;
+        crc16_backend = "pmull-arm";
+    }
+#endif
+}
+
+
+uint16_t
+modbus_crc16(const uint8_t *buf, size_t len)
+{
+    if (len >= 16 && crc16_blocks) {
+        size_t blocks = len & ~(size_t)15;
+        return crc16_bytewise(crc16_blocks(buf, blocks), buf + blocks, len - blocks);
+    }
+    return crc16_bytewise(0xFFFF, buf, len);
+}
+
+
+static PyObject *
+py_modbus_crc16(PyObject *Py_UNUSED(module), PyObject *data)
+{
+    Py_buffer view;
+    uint16_t crc;
+
+    if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+    crc = modbus_crc16((const uint8_t *)view.buf, (size_t)view.len);
+    PyBuffer_Release(&view);
+    return PyLong_FromLong(crc);
+}
+
+
+static PyMethodDef crc16_methods[] = {
+    {"modbus_crc16", py_modbus_crc16, METH_O,
+     "Return the (not byte swapped) modbus crc16 of a bytes-like object."},
+    {NULL, NULL, 0, NULL}
+};
+
+
+static struct PyModuleDef crc16_module = {
+    PyModuleDef_HEAD_INIT,
+    "pymodbus._crc16_clmul",
+    "Native modbus crc16.",
+    -1,
+    crc16_methods,
+    NULL, NULL, NULL, NULL
+};
+
+
+PyMODINIT_FUNC
+PyInit__crc16_clmul(void)
+{
+    PyObject *module;
+
+    crc16_table_init();
+    crc16_select();
+    if ((module = PyModule_Create(&crc16_module)) == NULL) {
+        return NULL;
+    }
+    if (PyModule_AddStringConstant(module, "BACKEND", crc16_backend) < 0) {
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
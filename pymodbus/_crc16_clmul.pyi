@@ -0,0 +1,7 @@
+"""Native modbus crc16."""
+from _typeshed import ReadableBuffer
+
+BACKEND: str
+
+def modbus_crc16(data: ReadableBuffer, /) -> int:
+    """Return the (not byte swapped) modbus crc16 of a bytes-like object."""
@@ -7,6 +7,7 @@ According to the selected type of modbus frame a prefix/suffix is added/removed
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Container
 
 from pymodbus.exceptions import ModbusIOException
 from pymodbus.factory import ClientDecoder, ServerDecoder
@@ -14,11 +15,15 @@ from pymodbus.logging import Log
 from pymodbus.pdu import ModbusRequest, ModbusResponse
 
 
+_U8_BYTES = [bytes((i,)) for i in range(256)]
+
+
 class FramerBase:
     """Intern base."""
 
     EMPTY = b''
     MIN_SIZE = 0
+    DECODE_WINDOW = 2 * 513  # bytes decoded at a time, 2 x largest frame (ascii)
 
     def __init__(
         self,
@@ -30,7 +35,8 @@ class FramerBase:
         self.dev_ids = dev_ids
         self.incoming_dev_id = 0
         self.incoming_tid = 0
-        self.databuffer = b""
+        self.databuffer = bytearray()
+        self._read_off = 0
 
     def decode(self, data: bytes) -> tuple[int, bytes]:
         """Decode ADU.
@@ -71,10 +77,22 @@ class FramerBase:
 
         :param message: The populated request/response to send
         """
-        data = message.function_code.to_bytes(1,'big') + message.encode()
+        fc = message.function_code
+        data = (_U8_BYTES[fc] if 0 <= fc < 256 else fc.to_bytes(1, "big")) + message.encode()
         packet = self.encode(data, message.slave_id, message.transaction_id)
         return packet
 
+    def reset_buffer(self) -> bytes:
+        """Empty the receive buffer.
+
+        returns:
+            unprocessed data, that was dropped (bytes)
+        """
+        data = bytes(self.databuffer[self._read_off:])
+        self.databuffer.clear()
+        self._read_off = 0
+        return data
+
     def processIncomingPacket(self, data: bytes, callback, slave, tid=None):
         """Process new packet pattern.
 
@@ -87,32 +105,66 @@ class FramerBase:
         The processed and decoded messages are pushed to the callback
         function to process and send.
         """
-        Log.debug("Processing: {}", data, ":hex")
-        self.databuffer += data
-        if self.databuffer == b'':
-            return
-        if not isinstance(slave, (list, tuple)):
-            slave = [slave]
-        while True:
-            if self.databuffer == b'':
-                return
-            used_len, data = self.decode(self.databuffer)
+        if debug := Log.debug_enabled():
+            Log.debug("Processing: {}", data, ":hex")
+        self.databuffer.extend(data)
+        slave_ids = self._slave_ids(slave)
+        while self._read_off < len(self.databuffer):
+            used_len, data = self._decode_next()
             if used_len:
-                self.databuffer = self.databuffer[used_len:]
+                self._read_off += used_len
+                if self._read_off > 4096 and self._read_off * 2 > len(self.databuffer):
+                    del self.databuffer[:self._read_off]
+                    self._read_off = 0
             if not data:
                 return
-            if slave and 0 not in slave and self.incoming_dev_id not in slave:
+            if (result := self._decode_pdu(data, slave_ids, tid, debug)) is not None:
+                callback(result)  # defer or push to a thread?
+
+    def _decode_next(self) -> tuple[int, bytes]:
+        """Decode the next frame in the receive buffer.
+
+        Only a window of the buffer is copied, so a read with many frames
+        is not copied once per frame. Without a frame in the window, the
+        complete rest of the buffer is decoded.
+        """
+        start = self._read_off
+        end = start + self.DECODE_WINDOW
+        with memoryview(self.databuffer) as view:
+            used_len, data = self.decode(bytes(view[start:end]))
+            if not data and end < len(self.databuffer):
+                used_len, data = self.decode(bytes(view[start:]))
+        return used_len, data
+
+    @staticmethod
+    def _slave_ids(slave) -> Container[int] | None:
+        """Return the accepted slave ids, None to accept all."""
+        if isinstance(slave, (list, tuple)):
+            return frozenset(slave) if slave and 0 not in slave else None
+        return (slave,) if slave else None
+
+    def _decode_pdu(
+        self, data: bytes, slave_ids: Container[int] | None, tid, debug: bool
+    ) -> ModbusRequest | ModbusResponse | None:
+        """Decode the pdu of a frame.
+
+        returns:
+            request/response, or None if the frame is not for slave_ids/tid,
+            in which case the rest of the receive buffer is dropped.
+        """
+        if slave_ids and self.incoming_dev_id not in slave_ids:
+            if debug:
                 Log.debug("Not a valid slave id - {}, ignoring!!", self.incoming_dev_id)
-                self.databuffer = b''
-                continue
-            if (result := self.decoder.decode(data)) is None:
-                self.databuffer = b''
-                raise ModbusIOException("Unable to decode request")
-            result.slave_id = self.incoming_dev_id
-            result.transaction_id = self.incoming_tid
+            self._read_off = len(self.databuffer)
+            return None
+        if (result := self.decoder.decode(data)) is None:
+            self._read_off = len(self.databuffer)
+            raise ModbusIOException("Unable to decode request")
+        result.slave_id = self.incoming_dev_id
+        result.transaction_id = self.incoming_tid
+        if debug:
             Log.debug("Frame advanced, resetting header!!")
-            self.databuffer = self.databuffer[used_len:]
-            if tid and result.transaction_id and tid != result.transaction_id:
-                self.databuffer = b''
-            else:
-                callback(result)  # defer or push to a thread?
+        if tid and result.transaction_id and tid != result.transaction_id:
+            self._read_off = len(self.databuffer)
+            return None
+        return result
@@ -1,10 +1,110 @@
 """Modbus RTU frame implementation."""
 from __future__ import annotations
 
-from pymodbus.framer.base import FramerBase
+import os
+import struct
+from array import array
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from pymodbus.framer.base import _U8_BYTES, FramerBase
 from pymodbus.logging import Log
 
 
+_compute_crc: Callable[[bytes], int] | None
+try:
+    from pymodbus._crc16_clmul import BACKEND as _CRC_BACKEND
+    from pymodbus._crc16_clmul import modbus_crc16 as _compute_crc
+except ImportError:  # pragma: no cover
+    _CRC_BACKEND = ""
+    _compute_crc = None
+
+_unpack_u64 = struct.Struct("<Q").unpack_from
+_pack_crc = struct.Struct("<H").pack
+_unpack_crc = struct.Struct("<H").unpack_from
+
+@lru_cache(maxsize=None)
+def _load_crc16_numba() -> Callable[[bytes], int] | None:
+    """Return the numba crc16, None if numba cannot be imported.
+
+    Importing numba and compiling the kernel takes ~0.5s (more on small
+    devices), so this is only done at import and only on request
+    (pip install pymodbus[numba] and PYMODBUS_NUMBA=1), never while
+    receiving a frame.
+    """
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        from numba import njit, types  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        return None
+    table_type = types.Array(types.uint16, 1, "C")
+
+    @njit(
+        [
+            types.uint16(types.Array(types.uint8, 1, "C", readonly=True), table_type),
+            types.uint16(types.Array(types.uint8, 1, "C"), table_type),
+        ],
+        cache=True,
+        nogil=True,
+    )
+    def crc16_kernel(buf, table):
+        """Compute the (not swapped) crc16 of a uint8 array."""
+        crc = 0xFFFF
+        for byte in buf:
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        return crc
+
+    table = np.frombuffer(FramerRTU.crc16_table, dtype=np.uint16)
+
+    def crc16(data: bytes) -> int:
+        """Compute the (not swapped) crc16 of a bytes-like object."""
+        return int(crc16_kernel(np.frombuffer(data, np.uint8), table))
+
+    crc16(b"\x00")  # first call dispatch is slow too
+    crc16(bytearray(1))
+    return crc16
+
+
+def _crc16_python(data: bytes) -> int:
+    """Compute the crc16 register with unrolled code, numba (if enabled) or the crc16 tables."""
+    if crc16 := _crc_specialized.get(len(data)) or _crc16_numba:
+        return crc16(data)
+    return _crc16_slice8(data)
+
+
+def _crc16_slice8(data: bytes) -> int:
+    """Compute the crc16 register with the slice-by-8 crc16 tables."""
+    crc = 0xFFFF
+    t0, t1, t2, t3, t4, t5, t6, t7 = FramerRTU.crc16_tables
+    tail = len(data) & ~7
+    for i in range(0, tail, 8):
+        word = _unpack_u64(data, i)[0] ^ crc
+        crc = (
+            t7[word & 0xFF] ^ t6[(word >> 8) & 0xFF]
+            ^ t5[(word >> 16) & 0xFF] ^ t4[(word >> 24) & 0xFF]
+            ^ t3[(word >> 32) & 0xFF] ^ t2[(word >> 40) & 0xFF]
+            ^ t1[(word >> 48) & 0xFF] ^ t0[word >> 56]
+        )
+    for byte in data[tail:]:
+        crc = (crc >> 8) ^ t0[(crc ^ byte) & 0xFF]
+    return crc
+
+
+_crc_specialized: dict[int, Callable[[bytes], int]] = {}
+_crc16_numba: Callable[[bytes], int] | None = None
+_crc16_cached = lru_cache(maxsize=1024)(_crc16_python)
+
+
+def _crc16_from_cache(data: bytes) -> int:
+    """Compute the crc16 register with the cached python implementation.
+
+    The python implementation is cached, as clients typically poll with
+    the same requests.
+    """
+    return _crc16_cached(bytes(data))
+
+
 class FramerRTU(FramerBase):
     """Modbus RTU frame type.
 
@@ -79,18 +179,52 @@ class FramerRTU(FramerBase):
 
         .. note:: This will only be generated once
         """
-        result = []
-        for byte in range(256):
-            crc = 0x0000
-            for _ in range(8):
-                if (byte ^ crc) & 0x0001:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
-                byte >>= 1
-            result.append(crc)
+        result = list(range(256))
+        for _ in range(8):
+            result = [(crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1 for crc in result]
         return result
-    crc16_table: list[int] = [0]
+    crc16_table: array[int] = array("H", [0])
+
+    @classmethod
+    def generate_crc16_slice_tables(cls) -> list[list[int]]:
+        """Generate the 8 slice-by-8 crc16 lookup tables.
+
+        Table k holds the crc of a byte followed by k zero bytes,
+        table 0 is identical to crc16_table.
+
+        .. note:: This will only be generated once
+        """
+        result = [list(cls.crc16_table)]
+        for _ in range(7):
+            result.append([(crc >> 8) ^ cls.crc16_table[crc & 0xFF] for crc in result[-1]])
+        return result
+    crc16_tables: list[list[int]] = [[]] * 8  # filled at import
+
+    @classmethod
+    def generate_crc16_specialized(cls) -> dict[int, Callable[[bytes], int]]:
+        """Generate unrolled crc16 functions for the common short frame sizes.
+
+        Each function is straight line code for one data length,
+        without loop overhead.
+
+        .. note:: This will only be generated once
+        """
+        result = {}
+        for size in (4, 6, 8, 10, 12):
+            lines = [
+                "def crc16(data, table=table):",
+                "    " + ", ".join(f"b{i}" for i in range(size)) + ", = data",
+                "    crc = 0xFFFF",
+            ]
+            lines += [f"    crc = (crc >> 8) ^ table[(crc ^ b{i}) & 0xFF]" for i in range(size)]
+            lines.append("    return crc")
+            namespace: dict[str, Any] = {"table": cls.crc16_tables[0]}
+            exec("\n".join(lines), namespace)  # noqa: S102  # pylint: disable=exec-used
+            result[size] = namespace["crc16"]
+        return result
+
+    # raw crc16 register (not swapped), native implementation if available
+    _crc16 = staticmethod(_compute_crc or _crc16_from_cache)
 
 
     def specific_decode(self, data: bytes, data_len: int) -> tuple[int, bytes]:
@@ -117,9 +251,7 @@ class FramerRTU(FramerBase):
                     continue
                 return used_len, self.EMPTY
             start_crc = used_len + size -2
-            crc = data[start_crc : start_crc + 2]
-            crc_val = (int(crc[0]) << 8) + int(crc[1])
-            if not FramerRTU.check_CRC(data[used_len : start_crc], crc_val):
+            if FramerRTU._crc16(data[used_len : start_crc]) != _unpack_crc(data, start_crc)[0]:
                 Log.debug("Frame check failed, ignoring!!")
                 continue
             return start_crc + 2, data[used_len + 1 : start_crc]
@@ -128,8 +260,8 @@ class FramerRTU(FramerBase):
 
     def encode(self, pdu: bytes, device_id: int, _tid: int) -> bytes:
         """Encode ADU."""
-        packet = device_id.to_bytes(1,'big') + pdu
-        return packet + FramerRTU.compute_CRC(packet).to_bytes(2,'big')
+        packet = (_U8_BYTES[device_id] if 0 <= device_id < 256 else device_id.to_bytes(1, "big")) + pdu
+        return packet + _pack_crc(FramerRTU._crc16(packet))
 
     @classmethod
     def check_CRC(cls, data: bytes, check: int) -> bool:
@@ -151,11 +283,44 @@ class FramerRTU(FramerBase):
         :param data: The data to create a crc16 of
         :returns: The calculated CRC
         """
-        crc = 0xFFFF
-        for data_byte in data:
-            idx = cls.crc16_table[(crc ^ int(data_byte)) & 0xFF]
-            crc = ((crc >> 8) & 0xFF) ^ idx
-        swapped = ((crc << 8) & 0xFF00) | ((crc >> 8) & 0x00FF)
-        return swapped
+        return int.from_bytes(cls._crc16(data).to_bytes(2, "little"), "big")
+
+FramerRTU.crc16_table = array("H", FramerRTU.generate_crc16_table())
+FramerRTU.crc16_tables = FramerRTU.generate_crc16_slice_tables()
+_crc_specialized.update(FramerRTU.generate_crc16_specialized())
+if not _compute_crc and os.environ.get("PYMODBUS_NUMBA") == "1":
+    _crc16_numba = _load_crc16_numba()
+
+
+def crc_backend() -> str:
+    """Return the crc16 implementation selected at import.
+
+    - "clmul-x86": native, PCLMULQDQ carry-less multiply
+    - "pmull-arm": native, ARMv8 PMULL carry-less multiply
+    - "table1": native, bytewise table (cpu without carry-less multiply)
+    - "numba": python, compiled with numba
+    - "slice8": python, slice-by-8 tables
+
+    The hardware crc32 instructions of x86 and ARM are not usable,
+    they do not support the modbus polynomial.
+    """
+    if _compute_crc:
+        return _CRC_BACKEND
+    return "numba" if _crc16_numba else "slice8"
+
+
+def _crc16_function(name: str) -> Callable[[bytes], int] | None:
+    """Return a crc16 implementation, e.g. to compare or benchmark them.
+
+    :param name: "native", "numba", "slice8" or "python" (cached, used without native)
+    :returns: function computing the crc16 register (not swapped), None if not available
+    :raises KeyError: unknown name
+    """
+    if name == "numba":
+        return _load_crc16_numba()
+    return {"native": _compute_crc, "slice8": _crc16_slice8, "python": _crc16_from_cache}[name]
+
 
-FramerRTU.crc16_table = FramerRTU.generate_crc16_table()
+def _crc16_cache_info():
+    """Return hits/misses of the python crc16 cache."""
+    return _crc16_cached.cache_info()
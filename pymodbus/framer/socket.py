@@ -1,10 +1,15 @@
 """Modbus Socket frame implementation."""
 from __future__ import annotations
 
+import struct
+
 from pymodbus.framer.base import FramerBase
 from pymodbus.logging import Log
 
 
+_pack_mbap = struct.Struct(">HHHB").pack
+
+
 class FramerSocket(FramerBase):
     """Modbus Socket frame type.
 
@@ -31,11 +36,4 @@ class FramerSocket(FramerBase):
 
     def encode(self, pdu: bytes, device_id: int, tid: int) -> bytes:
         """Encode ADU."""
-        packet = (
-           tid.to_bytes(2, 'big') +
-           b'\x00\x00' +
-           (len(pdu) + 1).to_bytes(2, 'big') +
-           device_id.to_bytes(1, 'big') +
-           pdu
-        )
-        return packet
+        return _pack_mbap(tid, 0, len(pdu) + 1, device_id) + pdu
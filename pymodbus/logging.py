@@ -96,6 +96,14 @@ class Log:
         if cls._logger.isEnabledFor(logging.INFO):
             cls._logger.info(cls.build_msg(txt, *args), stacklevel=2)
 
+    @classmethod
+    def debug_enabled(cls) -> bool:
+        """Return True if debug messages are logged.
+
+        Allows hot paths to skip calling debug() entirely.
+        """
+        return cls._logger.isEnabledFor(logging.DEBUG)
+
     @classmethod
     def debug(cls, txt, *args):
         """Log debug messages."""
@@ -191,10 +191,9 @@ class SyncModbusTransactionManager(ModbusTransactionManager):
                 request.transaction_id = self.getNextTID()
                 Log.debug("Running transaction {}", request.transaction_id)
                 if _buffer := hexlify_packets(
-                    self.client.framer.message_handler.databuffer
+                    self.client.framer.message_handler.reset_buffer()
                 ):
                     Log.debug("Clearing current Frame: - {}", _buffer)
-                    self.client.framer.message_handler.databuffer = b''
                 broadcast = not request.slave_id
                 expected_response_length = None
                 if not isinstance(self.client.framer, ModbusSocketFramer):
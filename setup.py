@@ -0,0 +1,56 @@
+"""Build the optional native extensions.
+
+Project metadata is in pyproject.toml, this file only adds the C extensions.
+
+The extensions are opt-in, set PYMODBUS_NATIVE=1 to build them::
+
+   PYMODBUS_NATIVE=1 pip install .
+
+otherwise pymodbus is built as a pure python package (py3-none-any wheel)
+and uses the python implementation. Even when enabled the extensions are
+optional: if they cannot be compiled pymodbus falls back to python.
+"""
+import os
+import sysconfig
+
+from setuptools import Extension, setup
+
+
+def crc16_target_arm() -> bool:
+    """Return True if the build target (not the build host) is 64 bit ARM only."""
+    platform = sysconfig.get_platform()  # follows _PYTHON_HOST_PLATFORM for cross builds
+    if platform.startswith("macosx"):
+        if archflags := os.environ.get("ARCHFLAGS"):
+            return archflags.split()[1::2] == ["arm64"]
+        return platform.endswith("-arm64")
+    return platform.endswith(("-aarch64", "-arm64"))
+
+
+def crc16_compile_args() -> list[str]:
+    """Return compiler flags for the crc16 extension.
+
+    On x86-64 the carry-less multiply code is compiled with target
+    attributes and selected at runtime, on aarch64 the crypto extension
+    must be enabled for the whole file and is checked at runtime.
+    Multi architecture builds (e.g. universal2) do not get the aarch64
+    flag, and use the bytewise table on ARM.
+    """
+    if sysconfig.get_platform().startswith("win"):
+        return []
+    if crc16_target_arm():
+        return ["-O3", "-march=armv8-a+crypto"]
+    return ["-O3"]
+
+
+ext_modules = []
+if os.environ.get("PYMODBUS_NATIVE") == "1":
+    ext_modules.append(
+        Extension(
+            "pymodbus._crc16_clmul",
+            sources=["pymodbus/_crc16_clmul.c"],
+            extra_compile_args=crc16_compile_args(),
+            optional=True,
+        )
+    )
+
+setup(ext_modules=ext_modules)
@@ -1,14 +1,17 @@
 """Test framer."""
-
+import sys
+from unittest import mock
 
 import pytest
 
+from pymodbus.exceptions import NotImplementedException
 from pymodbus.factory import ClientDecoder
-from pymodbus.framer import FramerType
+from pymodbus.framer import FramerType, rtu
 from pymodbus.framer.ascii import FramerAscii
 from pymodbus.framer.rtu import FramerRTU
 from pymodbus.framer.socket import FramerSocket
 from pymodbus.framer.tls import FramerTLS
+from pymodbus.pdu.register_read_message import ReadHoldingRegistersResponse
 
 
 class TestFramer:
@@ -46,6 +49,20 @@ class TestFramer:
         assert len(FramerRTU.crc16_table) == 256
         assert isinstance(FramerRTU.crc16_table[0], int)
         assert isinstance(FramerRTU.crc16_table[255], int)
+        assert memoryview(FramerRTU.crc16_table).nbytes == 512
+
+    def test_crc16_slice_tables(self):
+        """Test the slice-by-8 tables are prefilled."""
+        assert len(FramerRTU.crc16_tables) == 8
+        assert FramerRTU.crc16_tables[0] == list(FramerRTU.crc16_table)
+        assert all(len(table) == 256 for table in FramerRTU.crc16_tables)
+
+    def test_slice_CRC(self):
+        """Test table crc16 with 8 byte words and a tail."""
+        data = b'\x12\x34\x23\x45\x34\x56\x45\x67' * 2 + b'\x89'
+        crc16 = rtu._crc16_function("slice8")  # pylint: disable=protected-access
+        assert crc16(data[:8]) == 0xDBE2
+        assert crc16(data) == 0x540C
 
     def test_roundtrip_CRC(self):
         """Test combined compute/check CRC."""
@@ -53,6 +70,52 @@ class TestFramer:
         assert FramerRTU.compute_CRC(data) == 0xE2DB
         assert FramerRTU.check_CRC(data, 0xE2DB)
 
+    @pytest.mark.parametrize("name", ["native", "numba", "python"])
+    @pytest.mark.parametrize("length", [0, 1, 4, 8, 12, 15, 16, 17, 63, 64, 65, 127, 128, 255, 1000])
+    def test_implementation_CRC(self, name, length):
+        """Test each crc16 implementation matches the crc16 tables."""
+        if not (crc16 := rtu._crc16_function(name)):  # pylint: disable=protected-access
+            pytest.skip(f"{name} crc16 not available")
+        data = bytes((i * 37 + 11) & 0xFF for i in range(length))
+        expect = rtu._crc16_function("slice8")(data)  # pylint: disable=protected-access
+        assert crc16(data) == expect
+        assert crc16(bytearray(data)) == expect
+
+    @pytest.mark.parametrize("length", [4, 6, 8, 10, 12])
+    def test_specialized_CRC(self, length):
+        """Test unrolled crc16 matches the crc16 tables."""
+        data = bytes((i * 37 + 11) & 0xFF for i in range(length))
+        crc16 = FramerRTU.generate_crc16_specialized()[length]
+        assert crc16(data) == rtu._crc16_function("slice8")(data)  # pylint: disable=protected-access
+
+    def test_crc_backend(self):
+        """Test the selected crc16 backend is reported."""
+        if rtu._crc16_function("native"):  # pylint: disable=protected-access
+            assert rtu.crc_backend() in {"clmul-x86", "pmull-arm", "table1"}
+        else:
+            assert rtu.crc_backend() in {"numba", "slice8"}
+        with pytest.raises(KeyError):
+            rtu._crc16_function("unknown")  # pylint: disable=protected-access
+
+    def test_crc_backend_numba_not_importable(self):
+        """Test numba is not reported when it is installed, but cannot be imported."""
+        rtu._load_crc16_numba.cache_clear()  # pylint: disable=protected-access
+        with mock.patch.dict(sys.modules, {"numba": None}):
+            crc16_numba = rtu._load_crc16_numba()  # pylint: disable=protected-access
+        rtu._load_crc16_numba.cache_clear()  # pylint: disable=protected-access
+        assert not crc16_numba
+        with mock.patch("pymodbus.framer.rtu._compute_crc", None), \
+                mock.patch("pymodbus.framer.rtu._crc16_numba", crc16_numba):
+            assert rtu.crc_backend() == "slice8"
+
+    def test_cached_CRC(self):
+        """Test the python crc16 is cached."""
+        data = b'\x12\x34\x23\x45\x34\x56\x45\x67\x78'
+        crc16 = rtu._crc16_function("python")  # pylint: disable=protected-access
+        hits = rtu._crc16_cache_info().hits  # pylint: disable=protected-access
+        assert crc16(data) == crc16(memoryview(data))
+        assert rtu._crc16_cache_info().hits > hits  # pylint: disable=protected-access
+
 
 class TestFramerType:
     """Test classes."""
@@ -177,6 +240,17 @@ class TestFramerType:
         encoded_data = frame_obj.encode(data, dev_id, tr_id)
         assert encoded_data == expected
 
+    @pytest.mark.parametrize("dev_id", [-1, 256])
+    def test_encode_invalid_id(self, dev_id):
+        """Test encode rejects a device id/function code outside a byte."""
+        frame_obj = FramerRTU(ClientDecoder(), [0])
+        with pytest.raises(OverflowError):
+            frame_obj.encode(b"\x03", dev_id, 0)
+        message = ReadHoldingRegistersResponse([1])
+        message.function_code = dev_id
+        with pytest.raises(OverflowError):
+            frame_obj.buildPacket(message)
+
     @pytest.mark.parametrize(
         ("entry", "is_server", "data", "dev_id", "tr_id", "expected"),
         [
@@ -339,3 +413,68 @@ class TestFramerType:
         assert data == res_data
         assert dev_id == test_framer.incoming_dev_id
         assert res_len == len(res_msg)
+
+    @pytest.mark.parametrize(("entry"), [FramerType.SOCKET])
+    def test_processIncomingPacket_buffer(self, test_framer):
+        """Test the receive buffer is consumed and compacted."""
+        frame = b'\x00\x05\x00\x00\x00\x06\x07\x01\x05\x04\x00\x17'
+        callback = mock.Mock()
+        for _ in range(500):
+            test_framer.processIncomingPacket(frame, callback, 0)
+        assert callback.call_count == 500
+        assert len(test_framer.databuffer) <= 4096 + len(frame)
+        test_framer.processIncomingPacket(frame[:5], callback, 0)
+        assert callback.call_count == 500
+        assert test_framer.reset_buffer() == frame[:5]
+        assert not test_framer.databuffer
+
+    @pytest.mark.parametrize(("entry"), [FramerType.SOCKET, FramerType.RTU])
+    @pytest.mark.parametrize(("chunk"), [1, 5, 24])
+    def test_processIncomingPacket_split(self, test_framer, entry, chunk):
+        """Test frames split over several calls are each decoded once."""
+        frame = test_framer.encode(b'\x03\x04\x00\x8d\x00\x8e', 17, 0)
+        stream = frame * 3
+        callback = mock.Mock()
+        for i in range(0, len(stream), chunk):
+            test_framer.processIncomingPacket(stream[i : i + chunk], callback, [17])
+        assert callback.call_count == 3, entry
+        assert not test_framer.reset_buffer()
+
+    @pytest.mark.parametrize(("entry"), [FramerType.SOCKET, FramerType.RTU])
+    def test_processIncomingPacket_window(self, test_framer, entry):
+        """Test frames beyond the decode window, in one read."""
+        frame = test_framer.encode(b'\x03\x04\x00\x8d\x00\x8e', 17, 0)
+        callback = mock.Mock()
+        test_framer.processIncomingPacket(frame * 300, callback, [17])
+        assert callback.call_count == 300, entry
+        if entry == FramerType.RTU:
+            garble = b'\xff' * (2 * test_framer.DECODE_WINDOW)
+            test_framer.processIncomingPacket(garble + frame, callback, [17])
+            assert callback.call_count == 301
+        assert not test_framer.reset_buffer()
+
+    @pytest.mark.parametrize(("entry"), [FramerType.SOCKET])
+    def test_processIncomingPacket_drop(self, test_framer):
+        """Test dropped data is skipped."""
+        frame = b'\x00\x05\x00\x00\x00\x06\x07\x01\x05\x04\x00\x17'
+        callback = mock.Mock()
+        test_framer.processIncomingPacket(frame + frame[:5], callback, [1])
+        callback.assert_not_called()
+        assert not test_framer.reset_buffer()
+        test_framer.processIncomingPacket(frame, callback, [7])
+        callback.assert_called_once()
+
+    @pytest.mark.parametrize(("entry"), [FramerType.RTU])
+    def test_processIncomingPacket_raise(self, test_framer):
+        """Test the receive buffer can grow while a decode exception is kept."""
+        frame = test_framer.encode(b'\x03\x04\x00\x8d\x00\x8e', 17, 0)
+        callback = mock.Mock()
+        with mock.patch.object(
+            ReadHoldingRegistersResponse,
+            "calculateRtuFrameSize",
+            side_effect=NotImplementedException,
+        ), pytest.raises(NotImplementedException) as exc:
+            test_framer.processIncomingPacket(frame, callback, [17])
+        test_framer.processIncomingPacket(frame, callback, [17])
+        assert exc.value.__traceback__
+        assert callback.call_count == 2
@@ -21,6 +21,13 @@ class TestLogging:
             Log.debug("test2")
             build_msg_mock.assert_called_once()
 
+    def test_log_debug_enabled(self):
+        """Test debug_enabled follows the log level."""
+        Log.setLevel(logging.INFO)
+        assert not Log.debug_enabled()
+        Log.setLevel(logging.DEBUG)
+        assert Log.debug_enabled()
+
     def test_log_simple(self):
         """Test simple string."""
         txt = "simple string"